@@ -4,8 +4,10 @@ Sistema de locadora de carros usando padrões de projeto:
 """
 
 from __future__ import annotations
+import sys
 from abc import ABC, abstractmethod
-from typing import List
+from enum import IntEnum
+from typing import Callable, List, Optional, Protocol, Tuple
 
 
 
@@ -14,19 +16,37 @@ from typing import List
 # decoradores sobre o carro base, sem necessidade de criar subclasses para cada
 #combinação possível de recursos.
 
-class Car(ABC):
-    
+#tipos de carro e extras são convertidos para inteiros na entrada; dentro do
+#sistema as comparações e buscas nas tabelas usam esses identificadores
 
-    @abstractmethod
+
+class CarType(IntEnum):
+    ECONOMY = 0
+    SUV = 1
+    LUXURY = 2
+
+
+class Extra(IntEnum):
+    GPS = 0
+    CHILD_SEAT = 1
+    INSURANCE = 2
+
+
+#Car e PricingStrategy, assim como Observer e Subject, são protocolos: as
+#classes concretas cumprem a interface sem herdar dela
+
+
+class Car(Protocol):
     def daily_rate(self) -> float:
-        pass
+        ...
 
-    @abstractmethod
     def description(self) -> str:
-        pass
+        ...
+
 
+class EconomyCar:
+    __slots__ = ()
 
-class EconomyCar(Car):
     def daily_rate(self) -> float:
         return 120.0
 
@@ -34,7 +54,9 @@ class EconomyCar(Car):
         return "Carro Econômico"
 
 
-class SuvCar(Car):
+class SuvCar:
+    __slots__ = ()
+
     def daily_rate(self) -> float:
         return 220.0
 
@@ -42,7 +64,9 @@ class SuvCar(Car):
         return "SUV"
 
 
-class LuxuryCar(Car):
+class LuxuryCar:
+    __slots__ = ()
+
     def daily_rate(self) -> float:
         return 400.0
 
@@ -50,41 +74,82 @@ class LuxuryCar(Car):
         return "Carro de Luxo"
 
 
-class CarDecorator(Car):
+#os carros base não guardam estado, então uma instância de cada tipo é criada
+#na importação e compartilhada por todas as reservas
+_BASE_CARS = {
+    CarType.ECONOMY: EconomyCar(),
+    CarType.SUV: SuvCar(),
+    CarType.LUXURY: LuxuryCar(),
+}
+
+
+class CarDecorator:
     
 
+    __slots__ = ("_car", "_rate", "_description")
+
+    #acréscimo na diária e nome do extra; cada decorador concreto define os seus
+    extra_rate = 0.0
+    extra_name = ""
+
     def __init__(self, car: Car):
         self._car = car
+        #a diária acumulada é calculada uma única vez na montagem, assim as
+        #chamadas não percorrem a cadeia inteira
+        self._rate = car.daily_rate() + self.extra_rate
+        self._description: Optional[str] = None
+
+    def daily_rate(self) -> float:
+        return self._rate
+
+    def description(self) -> str:
+        #a descrição só é montada quando pedida (normalmente só no decorador
+        #mais externo): uma passada pela cadeia e um único join, em vez de
+        #concatenar uma string nova a cada nível
+        if self._description is None:
+            names = []
+            car: Car = self
+            while isinstance(car, CarDecorator):
+                names.append(car.extra_name)
+                car = car._car
+            names.append(car.description())
+            names.reverse()
+            self._description = " + ".join(names)
+        return self._description
 
 
 class GPSDecorator(CarDecorator):
     
 
-    def daily_rate(self) -> float:
-        return self._car.daily_rate() + 20.0
+    __slots__ = ()
 
-    def description(self) -> str:
-        return self._car.description() + " + GPS"
+    extra_rate = 20.0
+    extra_name = "GPS"
 
 
 class ChildSeatDecorator(CarDecorator):
     
 
-    def daily_rate(self) -> float:
-        return self._car.daily_rate() + 15.0
+    __slots__ = ()
 
-    def description(self) -> str:
-        return self._car.description() + " + Cadeirinha"
+    extra_rate = 15.0
+    extra_name = "Cadeirinha"
 
 
 class ExtraInsuranceDecorator(CarDecorator):
     
 
-    def daily_rate(self) -> float:
-        return self._car.daily_rate() + 50.0
+    __slots__ = ()
+
+    extra_rate = 50.0
+    extra_name = "Seguro Extra"
 
-    def description(self) -> str:
-        return self._car.description() + " + Seguro Extra"
+
+_EXTRA_DECORATORS = {
+    Extra.GPS: GPSDecorator,
+    Extra.CHILD_SEAT: ChildSeatDecorator,
+    Extra.INSURANCE: ExtraInsuranceDecorator,
+}
 
 
 
@@ -93,29 +158,34 @@ class ExtraInsuranceDecorator(CarDecorator):
 # Cada estratégia encapsula sua própria regra de negócio, evitando condicionais complexas dentro da classe Reservation.
 
 
-class PricingStrategy(ABC):
-    @abstractmethod
+class PricingStrategy(Protocol):
     def calculate_total(self, car: Car, days: int) -> float:
-        pass
+        ...
 
 
-class BasicPricing(PricingStrategy):
+class BasicPricing:
     
 
+    __slots__ = ()
+
     def calculate_total(self, car: Car, days: int) -> float:
         return car.daily_rate() * days
 
 
-class PremiumPricing(PricingStrategy):
+class PremiumPricing:
     
 
+    __slots__ = ()
+
     def calculate_total(self, car: Car, days: int) -> float:
         return car.daily_rate() * days * 1.15
 
 
-class LongTermPricing(PricingStrategy):
+class LongTermPricing:
     
 
+    __slots__ = ()
+
     def calculate_total(self, car: Car, days: int) -> float:
         base = car.daily_rate() * days
         if days >= 10:
@@ -125,69 +195,92 @@ class LongTermPricing(PricingStrategy):
         return base
 
 
+#as estratégias não guardam estado; uma instância de cada é compartilhada
+BASIC_PRICING = BasicPricing()
+PREMIUM_PRICING = PremiumPricing()
+LONG_TERM_PRICING = LongTermPricing()
+
+
 
 #Observer
 #Permite que serviços externos (e-mail, SMS e log) recebam notificações
 #automáticas sempre que o status da reserva muda. Evita acoplamento direto entre
 #a reserva e os serviços de notificação.
+#Observer e Subject são protocolos (tipagem estrutural): qualquer objeto com
+#os métodos certos serve, sem herança nem verificação de métodos abstratos
 
 
-class Observer(ABC):
-    @abstractmethod
-    def update(self, message: str) -> None:
-        pass
+class Observer(Protocol):
+    def format(self, message: str) -> str:
+        ...
 
 
-class Subject(ABC):
-    @abstractmethod
+class Subject(Protocol):
     def attach(self, observer: Observer) -> None:
-        pass
+        ...
 
-    @abstractmethod
     def detach(self, observer: Observer) -> None:
-        pass
+        ...
 
-    @abstractmethod
     def notify(self, message: str) -> None:
-        pass
+        ...
 
 
-class ReservationNotifier(Subject):
+class ReservationNotifier:
     
 
+    __slots__ = ("_observers", "_formats")
+
     def __init__(self) -> None:
         self._observers: List[Observer] = []
+        #métodos format já vinculados, refeitos a cada attach/detach; notify
+        #percorre só essa tupla
+        self._formats: Tuple[Callable[[str], str], ...] = ()
 
     def attach(self, observer: Observer) -> None:
         self._observers.append(observer)
+        self._refresh()
 
     def detach(self, observer: Observer) -> None:
         self._observers.remove(observer)
+        self._refresh()
 
     def notify(self, message: str) -> None:
-        for obs in self._observers:
-            obs.update(message)
+        #cada observador formata a sua linha e todas saem em uma única escrita,
+        #em vez de uma escrita (e, no terminal, um flush) por observador
+        if self._formats:
+            lines = [fmt(message) for fmt in self._formats]
+            sys.stdout.write("\n".join(lines) + "\n")
+
+    def _refresh(self) -> None:
+        self._formats = tuple(obs.format for obs in self._observers)
 
 
-class EmailService(Observer):
+class EmailService:
     
 
-    def update(self, message: str) -> None:
-        print(f"[E-mail] {message}")
+    __slots__ = ()
+
+    def format(self, message: str) -> str:
+        return f"[E-mail] {message}"
 
 
-class SMSService(Observer):
+class SMSService:
     
 
-    def update(self, message: str) -> None:
-        print(f"[SMS] {message}")
+    __slots__ = ()
 
+    def format(self, message: str) -> str:
+        return f"[SMS] {message}"
 
-class AuditLog(Observer):
+
+class AuditLog:
     
 
-    def update(self, message: str) -> None:
-        print(f"[Log Auditoria] {message}")
+    __slots__ = ()
+
+    def format(self, message: str) -> str:
+        return f"[Log Auditoria] {message}"
 
 
 #reserva 
@@ -195,6 +288,22 @@ class AuditLog(Observer):
 class Reservation:
     
 
+    #car, days e pricing_strategy são atributos públicos, mas não devem ser
+    #reatribuídos: o total e o resumo são calculados uma vez no __init__ e
+    #ficariam desatualizados sem nenhum erro
+
+    __slots__ = (
+        "customer_name",
+        "car",
+        "days",
+        "pricing_strategy",
+        "reservation_type",
+        "notifier",
+        "status",
+        "_summary",
+        "_status_prefix",
+    )
+
     def __init__(
         self,
         customer_name: str,
@@ -213,13 +322,17 @@ class Reservation:
         self.notifier = notifier
         self.status = "criada"
 
-    def summarize(self) -> str:
-        total = self.pricing_strategy.calculate_total(self.car, self.days)
-        return (
-            f"Reserva de {self.customer_name}: "
-            f"{self.car.description()} por {self.days} dia(s) "
-            f"({self.reservation_type}) - Total: R${total:.2f}"
+        #carro, dias e estratégia não mudam depois de criada a reserva, então o
+        #resumo e o início da mensagem de status são montados uma única vez
+        total = pricing_strategy.calculate_total(car, days)
+        self._summary = (
+            f"Reserva de {customer_name}: {car.description()} "
+            f"por {days} dia(s) ({reservation_type}) - Total: R${total:.2f}"
         )
+        self._status_prefix = f"Status alterado: {customer_name} → "
+
+    def summarize(self) -> str:
+        return self._summary
 
     def confirm(self) -> None:
         self.status = "confirmada"
@@ -227,9 +340,7 @@ class Reservation:
 
     def set_status(self, new_status: str) -> None:
         self.status = new_status
-        self.notifier.notify(
-            f"Status alterado: {self.customer_name} → {self.status}"
-        )
+        self.notifier.notify(self._status_prefix + new_status)
 
 
 
@@ -241,133 +352,170 @@ class Reservation:
 class ReservationFactory(ABC):
     
 
+    __slots__ = ("notifier",)
+
     def __init__(self, notifier: ReservationNotifier) -> None:
         self.notifier = notifier
 
-    @abstractmethod
     def create_reservation(
         self,
         customer_name: str,
-        car_type: str,
-        extras: List[str],
+        car_type: CarType,
+        extras: List[Extra],
         days: int,
         pricing_strategy: PricingStrategy,
     ) -> Reservation:
-        pass
-
-    def _create_car_with_extras(self, car_type: str, extras: List[str]) -> Car:
-        
-
-        if car_type == "economy":
-            car: Car = EconomyCar()
-        elif car_type == "suv":
-            car = SuvCar()
-        elif car_type == "luxury":
-            car = LuxuryCar()
-        else:
+        car: Optional[Car] = _BASE_CARS.get(car_type)
+        if car is None:
             raise ValueError("Tipo de carro desconhecido.")
 
         for extra in extras:
-            if extra == "gps":
-                car = GPSDecorator(car)
-            elif extra == "child_seat":
-                car = ChildSeatDecorator(car)
-            elif extra == "insurance":
-                car = ExtraInsuranceDecorator(car)
+            decorator = _EXTRA_DECORATORS.get(extra)
+            if decorator is not None:
+                car = decorator(car)
 
-        return car
+        reservation = self._new_reservation(customer_name, car, days, pricing_strategy)
+        self.notifier.notify(
+            f"Nova reserva {self.label} criada: {reservation.summarize()}"
+        )
+        return reservation
+
+    #nome do canal usado na notificação; cada fábrica concreta define o seu
+    @property
+    @abstractmethod
+    def label(self) -> str:
+        pass
+
+    #factory method: cada fábrica concreta decide como a reserva é criada
+    @abstractmethod
+    def _new_reservation(
+        self,
+        customer_name: str,
+        car: Car,
+        days: int,
+        pricing_strategy: PricingStrategy,
+    ) -> Reservation:
+        pass
 
 
 class LocalReservationFactory(ReservationFactory):
     
 
-    def create_reservation(
+    __slots__ = ()
+
+    label = "local"
+
+    def _new_reservation(
         self,
         customer_name: str,
-        car_type: str,
-        extras: List[str],
+        car: Car,
         days: int,
         pricing_strategy: PricingStrategy,
     ) -> Reservation:
-        car = self._create_car_with_extras(car_type, extras)
-        reservation = Reservation(
+        return Reservation(
             customer_name, car, days, pricing_strategy, "balcão", self.notifier
         )
-        self.notifier.notify(f"Nova reserva local criada: {reservation.summarize()}")
-        return reservation
 
 
 class OnlineReservationFactory(ReservationFactory):
     
 
-    def create_reservation(
+    __slots__ = ()
+
+    label = "online"
+
+    def _new_reservation(
         self,
         customer_name: str,
-        car_type: str,
-        extras: List[str],
+        car: Car,
         days: int,
         pricing_strategy: PricingStrategy,
     ) -> Reservation:
-        car = self._create_car_with_extras(car_type, extras)
-        reservation = Reservation(
+        return Reservation(
             customer_name, car, days, pricing_strategy, "online", self.notifier
         )
-        self.notifier.notify(f"Nova reserva online criada: {reservation.summarize()}")
-        return reservation
 
 
 
 #interacao pelo terminal
 
+#menus montados uma única vez, cada um impresso com uma só escrita
+_MENU_RESERVA = """
+Tipo de reserva:
+1 - Local (balcão)
+2 - Online
+"""
+
+_MENU_CARRO = """
+Tipos de carro:
+1 - Carro Econômico
+2 - SUV
+3 - Carro de Luxo
+"""
+
+_MENU_EXTRAS = """
+Extras disponíveis:
+1 - GPS
+2 - Cadeirinha
+3 - Seguro Extra
+0 - Nenhum / Finalizar seleção
+"""
+
+_MENU_ESTRATEGIA = """
+Estratégia de preço:
+1 - Básico
+2 - Premium
+3 - Longa duração
+"""
+
+_MENU_PRINCIPAL = """
+Menu principal:
+1 - Criar nova reserva
+2 - Sair
+"""
+
+#opção digitada -> valor escolhido, no lugar das cadeias de if/elif
+_OPCOES_RESERVA = {"1": "local", "2": "online"}
+_OPCOES_CARRO = {"1": CarType.ECONOMY, "2": CarType.SUV, "3": CarType.LUXURY}
+_OPCOES_EXTRAS = {"1": Extra.GPS, "2": Extra.CHILD_SEAT, "3": Extra.INSURANCE}
+_OPCOES_ESTRATEGIA = {
+    "1": BASIC_PRICING,
+    "2": PREMIUM_PRICING,
+    "3": LONG_TERM_PRICING,
+}
+
+
 def escolher_tipo_reserva() -> str:
     while True:
-        print("\nTipo de reserva:")
-        print("1 - Local (balcão)")
-        print("2 - Online")
+        sys.stdout.write(_MENU_RESERVA)
         opc = input("Escolha uma opção: ").strip()
-        if opc == "1":
-            return "local"
-        elif opc == "2":
-            return "online"
-        else:
-            print("Opção inválida, tente novamente.")
+        tipo = _OPCOES_RESERVA.get(opc)
+        if tipo is not None:
+            return tipo
+        print("Opção inválida, tente novamente.")
 
 
-def escolher_tipo_carro() -> str:
+def escolher_tipo_carro() -> CarType:
     while True:
-        print("\nTipos de carro:")
-        print("1 - Carro Econômico")
-        print("2 - SUV")
-        print("3 - Carro de Luxo")
+        sys.stdout.write(_MENU_CARRO)
         opc = input("Escolha uma opção: ").strip()
-        if opc == "1":
-            return "economy"
-        elif opc == "2":
-            return "suv"
-        elif opc == "3":
-            return "luxury"
-        else:
-            print("Opção inválida, tente novamente.")
+        tipo = _OPCOES_CARRO.get(opc)
+        if tipo is not None:
+            return tipo
+        print("Opção inválida, tente novamente.")
 
 
-def escolher_extras() -> List[str]:
-    extras: List[str] = []
+def escolher_extras() -> List[Extra]:
+    extras: List[Extra] = []
     while True:
-        print("\nExtras disponíveis:")
-        print("1 - GPS")
-        print("2 - Cadeirinha")
-        print("3 - Seguro Extra")
-        print("0 - Nenhum / Finalizar seleção")
+        sys.stdout.write(_MENU_EXTRAS)
         opc = input("Escolha um extra (ou 0 para terminar): ").strip()
 
         if opc == "0":
             break
-        elif opc == "1":
-            extras.append("gps")
-        elif opc == "2":
-            extras.append("child_seat")
-        elif opc == "3":
-            extras.append("insurance")
+        extra = _OPCOES_EXTRAS.get(opc)
+        if extra is not None:
+            extras.append(extra)
         else:
             print("Opção inválida, tente novamente.")
 
@@ -388,19 +536,12 @@ def escolher_qtd_dias() -> int:
 
 def escolher_estrategia_preco() -> PricingStrategy:
     while True:
-        print("\nEstratégia de preço:")
-        print("1 - Básico")
-        print("2 - Premium")
-        print("3 - Longa duração")
+        sys.stdout.write(_MENU_ESTRATEGIA)
         opc = input("Escolha uma opção: ").strip()
-        if opc == "1":
-            return BasicPricing()
-        elif opc == "2":
-            return PremiumPricing()
-        elif opc == "3":
-            return LongTermPricing()
-        else:
-            print("Opção inválida, tente novamente.")
+        estrategia = _OPCOES_ESTRATEGIA.get(opc)
+        if estrategia is not None:
+            return estrategia
+        print("Opção inválida, tente novamente.")
 
 
 def atualizar_status_interativamente(reservation: Reservation) -> None:
@@ -429,13 +570,13 @@ def main():
     notifier.attach(AuditLog())
 
     #fabrica
-    local_factory = LocalReservationFactory(notifier)
-    online_factory = OnlineReservationFactory(notifier)
+    factories = {
+        "local": LocalReservationFactory(notifier),
+        "online": OnlineReservationFactory(notifier),
+    }
 
     while True:
-        print("\nMenu principal:")
-        print("1 - Criar nova reserva")
-        print("2 - Sair")
+        sys.stdout.write(_MENU_PRINCIPAL)
         opc = input("Escolha uma opção: ").strip()
 
         if opc == "2":
@@ -455,14 +596,9 @@ def main():
         pricing_strategy = escolher_estrategia_preco()
 
         
-        if tipo_reserva == "local":
-            reservation = local_factory.create_reservation(
-                customer_name, tipo_carro, extras, dias, pricing_strategy
-            )
-        else:
-            reservation = online_factory.create_reservation(
-                customer_name, tipo_carro, extras, dias, pricing_strategy
-            )
+        reservation = factories[tipo_reserva].create_reservation(
+            customer_name, tipo_carro, extras, dias, pricing_strategy
+        )
 
         
         reservation.confirm()
@@ -0,0 +1,95 @@
+"""
+Cálculo em lote do total das locações (ex.: recalcular um histórico de reservas).
+
+Aplica as mesmas regras de BasicPricing, PremiumPricing e LongTermPricing de
+locadora.py sobre arrays NumPy. Com o numba instalado o laço é compilado;
+sem ele a função roda como Python puro, com o mesmo resultado. Um identificador
+de estratégia desconhecido resulta em NaN.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba é opcional
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+        return wrap
+
+
+#identificadores das estratégias usados no array sid
+BASIC = 0
+PREMIUM = 1
+LONG_TERM = 2
+
+
+#cache=True guarda a compilação em disco e evita recompilar a cada execução
+@njit(cache=True)
+def total_cost(rates: np.ndarray, days: np.ndarray, sid: np.ndarray) -> np.ndarray:
+    out = np.empty(rates.shape[0])
+    for i in range(rates.shape[0]):
+        base = rates[i] * days[i]
+        s = sid[i]
+        if s == BASIC:
+            out[i] = base
+        elif s == PREMIUM:
+            out[i] = base * 1.15
+        elif s == LONG_TERM:
+            d = days[i]
+            if d >= 10:
+                out[i] = base * 0.8
+            elif d >= 5:
+                out[i] = base * 0.9
+            else:
+                out[i] = base
+        else:
+            #identificador desconhecido: sem preço, em vez de cair em outra regra
+            out[i] = np.nan
+    return out
+
+
+#confere o cálculo em lote contra as estratégias de locadora.py, de onde as
+#regras foram copiadas:  python pricing_batch.py
+def _check() -> None:
+    from locadora import (
+        BASIC_PRICING,
+        LONG_TERM_PRICING,
+        PREMIUM_PRICING,
+        EconomyCar,
+        LuxuryCar,
+        SuvCar,
+    )
+
+    strategies = {
+        BASIC: BASIC_PRICING,
+        PREMIUM: PREMIUM_PRICING,
+        LONG_TERM: LONG_TERM_PRICING,
+    }
+    cars = [EconomyCar(), SuvCar(), LuxuryCar()]
+    cases = [
+        (car, d, sid)
+        for car in cars
+        for d in (1, 4, 5, 9, 10, 15)
+        for sid in strategies
+    ]
+    totals = total_cost(
+        np.array([car.daily_rate() for car, _, _ in cases], dtype=np.float64),
+        np.array([d for _, d, _ in cases], dtype=np.int64),
+        np.array([sid for _, _, sid in cases], dtype=np.int64),
+    )
+    for (car, d, sid), total in zip(cases, totals):
+        expected = strategies[sid].calculate_total(car, d)
+        assert abs(total - expected) < 1e-9, (car.description(), d, sid, total)
+
+    unknown = total_cost(
+        np.array([120.0, 120.0]), np.array([3, 3]), np.array([3, -1])
+    )
+    assert np.isnan(unknown).all()
+    print(f"ok: {len(cases)} totais conferem com locadora.py")
+
+
+if __name__ == "__main__":
+    _check()